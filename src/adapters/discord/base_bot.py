@@ -514,28 +514,27 @@ class BaseMarketingBot(discord.Client):
 
     async def _handle_clear(self, message: discord.Message):
         """Clear conversation history. `!clear` = current channel, `!clear all` = all."""
-        args = message.content.strip().split()
-        if len(args) >= 2 and args[1].lower() == "all":
-            self._channel_history.clear()
-            await message.channel.send(f"[{self.bot_name}] 전체 대화 기록 초기화됨.")
-        else:
-            channel_id = message.channel.id
-            if channel_id in self._channel_history:
-                del self._channel_history[channel_id]
-            await message.channel.send(f"[{self.bot_name}] 이 채널 대화 기록 초기화됨.")
+        await message.channel.send(self._clear_history(message))
 
     async def _handle_clear_silent(self, message: discord.Message):
         """Clear history without sending a message (for team channel noise prevention)."""
+        self._clear_history(message)
+
+    def _clear_history(self, message: discord.Message) -> str:
+        """Apply !clear to the history and return the confirmation text."""
         args = message.content.strip().split()
         if len(args) >= 2 and args[1].lower() == "all":
             self._channel_history.clear()
-        else:
-            channel_id = message.channel.id
-            if channel_id in self._channel_history:
-                del self._channel_history[channel_id]
+            return f"[{self.bot_name}] 전체 대화 기록 초기화됨."
+        self._channel_history.pop(message.channel.id, None)
+        return f"[{self.bot_name}] 이 채널 대화 기록 초기화됨."
 
     async def _handle_help(self, message: discord.Message):
         """Show available commands."""
+        await message.channel.send(self._help_text())
+
+    def _help_text(self) -> str:
+        """Command list shown by !help."""
         lines = [
             f"**[{self.bot_name}] 명령어 목록**",
             "`!cancel @봇이름` — 특정 봇의 진행 중인 응답 취소",
@@ -548,7 +547,7 @@ class BaseMarketingBot(discord.Client):
             "`!clear all` — 전체 채널 대화 기록 초기화",
             "`!help` — 이 명령어 목록 표시",
         ]
-        await message.channel.send("\n".join(lines))
+        return "\n".join(lines)
 
     async def _alarm_loop(self):
         """Check alarms every 60 seconds and fire due ones."""
@@ -610,41 +609,40 @@ class BaseMarketingBot(discord.Client):
 
     async def _handle_alarms(self, message: discord.Message):
         """Handle !alarms command with subcommands: list, cancel <id>, cancel all."""
+        await message.channel.send(self._alarms_reply(message))
+
+    def _alarms_reply(self, message: discord.Message) -> str:
+        """Apply an !alarms command to the scheduler and return the reply text."""
         args = message.content.strip().split()
         # !alarms cancel all
         if len(args) >= 3 and args[1].lower() == "cancel" and args[2].lower() == "all":
             alarms = self._alarm_scheduler.list_alarms()
             if not alarms:
-                await message.channel.send(f"[{self.bot_name}] 취소할 알람 없음.")
-                return
+                return f"[{self.bot_name}] 취소할 알람 없음."
             count = 0
             for a in alarms:
                 self._alarm_scheduler.remove_alarm(a.alarm_id)
                 count += 1
-            await message.channel.send(f"[{self.bot_name}] 전체 알람 {count}건 취소 완료.")
-            return
+            return f"[{self.bot_name}] 전체 알람 {count}건 취소 완료."
 
         # !alarms cancel <alarm_id>
         if len(args) >= 3 and args[1].lower() == "cancel":
             alarm_id = args[2]
             if self._alarm_scheduler.remove_alarm(alarm_id):
-                await message.channel.send(f"[{self.bot_name}] 알람 `{alarm_id}` 취소 완료.")
-            else:
-                await message.channel.send(f"[{self.bot_name}] 알람 `{alarm_id}`을(를) 찾을 수 없음.")
-            return
+                return f"[{self.bot_name}] 알람 `{alarm_id}` 취소 완료."
+            return f"[{self.bot_name}] 알람 `{alarm_id}`을(를) 찾을 수 없음."
 
         # !alarms (list)
         alarms = self._alarm_scheduler.list_alarms()
         if not alarms:
-            await message.channel.send(f"[{self.bot_name}] 등록된 알람 없음.")
-            return
+            return f"[{self.bot_name}] 등록된 알람 없음."
         lines = [f"**[{self.bot_name}] 알람 목록 ({len(alarms)}건)**"]
         for a in alarms:
             sched = self._format_schedule(a)
             prompt_summary = a.prompt[:20] + "..." if len(a.prompt) > 20 else a.prompt
             last = a.last_run[:16] if a.last_run else "미실행"
             lines.append(f"- `{a.alarm_id}` | {sched} | {prompt_summary} | 마지막: {last}")
-        await message.channel.send("\n".join(lines))
+        return "\n".join(lines)
 
     @staticmethod
     def _escape_mentions(text: str) -> str:
@@ -132,10 +132,16 @@ class ClaudeExecutor:
 
 
 class CodexExecutor:
-    """Executes Codex CLI commands."""
+    """Executes Codex CLI commands.
 
-    def __init__(self):
+    Args:
+        runner: Coroutine ``(cmd_args, timeout) -> (proc, stdout, stderr)``
+            used to launch the CLI; tests substitute a fake.
+    """
+
+    def __init__(self, runner=run_cancellable):
         self.usage_tracker = UsageTracker()
+        self._runner = runner
 
     @staticmethod
     def _compose_prompt(message: str, system_prompt: Optional[str]) -> str:
@@ -183,7 +189,7 @@ class CodexExecutor:
         print(f"[{datetime.now().isoformat()}] Executing with Codex CLI")
 
         try:
-            proc, stdout, stderr = await run_cancellable(args, timeout=1200.0)
+            proc, stdout, stderr = await self._runner(args, timeout=1200.0)
             if proc.returncode != 0:
                 err_text = stderr.decode("utf-8").strip() or stdout.decode("utf-8").strip()
                 raise Exception(f"Exit code {proc.returncode}: {err_text}")
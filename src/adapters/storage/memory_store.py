@@ -0,0 +1,16 @@
+"""In-memory storage adapter — implements StoragePort without touching disk."""
+
+from typing import Dict, List
+
+
+class MemoryStorage:
+    """Dict-backed storage implementing StoragePort protocol (tests, ephemeral bots)."""
+
+    def __init__(self):
+        self._data: Dict[str, List] = {}
+
+    def load(self, key: str) -> list:
+        return list(self._data.get(key, []))
+
+    def save(self, key: str, data: list) -> None:
+        self._data[key] = list(data)
@@ -16,6 +16,8 @@ from typing import Dict, List, Optional
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from src.ports.outbound import StoragePort
+
 
 def _log(msg: str):
     print(msg, file=sys.stderr)
@@ -53,9 +55,24 @@ _MIN_INTERVAL_MINUTES = 10
 class AlarmScheduler:
     """Manages alarm entries for a single bot: CRUD, persistence, due-checking."""
 
-    def __init__(self, bot_name: str, storage_dir: str = "memory"):
+    def __init__(
+        self,
+        bot_name: str,
+        storage_dir: str = "memory",
+        storage: Optional[StoragePort] = None,
+    ):
+        """
+        Args:
+            bot_name: Owner bot name (used in the storage file name)
+            storage_dir: Directory holding the alarm JSON file
+            storage: Optional StoragePort; when given, alarms are loaded and
+                saved through it under key ``alarms_<bot_name>`` and
+                storage_dir is ignored
+        """
         self._bot_name = bot_name
-        self._storage_path = Path(storage_dir) / f"alarms_{bot_name}.json"
+        self._storage = storage
+        self._storage_key = f"alarms_{bot_name}"
+        self._storage_path = Path(storage_dir) / f"{self._storage_key}.json"
         self._alarms: Dict[str, AlarmEntry] = {}
         self._load()
 
@@ -236,39 +253,54 @@ class AlarmScheduler:
 
         return False
 
+    @staticmethod
+    def _entry_from_dict(item: dict) -> AlarmEntry:
+        """Build an AlarmEntry from a persisted dict, coercing field types."""
+        return AlarmEntry(
+            alarm_id=str(item["alarm_id"]),
+            schedule_type=str(item.get("schedule_type", "")),
+            hour=item.get("hour"),
+            minute=item.get("minute"),
+            interval_minutes=item.get("interval_minutes"),
+            tz=str(item.get("tz", "Asia/Seoul")),
+            prompt=str(item.get("prompt", "")),
+            channel_id=int(item.get("channel_id", 0)),
+            created_by=str(item.get("created_by", "")),
+            created_at=str(item.get("created_at", "")),
+            last_run=str(item.get("last_run", "")),
+            fire_at=str(item.get("fire_at", "")),
+            enabled=bool(item.get("enabled", True)),
+        )
+
     def _load(self):
-        """Load alarms from JSON file."""
+        """Load alarms from the storage port or JSON file."""
         self._alarms.clear()
         try:
-            if self._storage_path.exists():
+            if self._storage is not None:
+                raw = self._storage.load(self._storage_key)
+            elif not self._storage_path.exists():
+                return
+            else:
                 raw = json.loads(self._storage_path.read_text(encoding="utf-8"))
-                if isinstance(raw, list):
-                    for item in raw:
-                        if isinstance(item, dict) and "alarm_id" in item:
-                            entry = AlarmEntry(
-                                alarm_id=str(item["alarm_id"]),
-                                schedule_type=str(item.get("schedule_type", "")),
-                                hour=item.get("hour"),
-                                minute=item.get("minute"),
-                                interval_minutes=item.get("interval_minutes"),
-                                tz=str(item.get("tz", "Asia/Seoul")),
-                                prompt=str(item.get("prompt", "")),
-                                channel_id=int(item.get("channel_id", 0)),
-                                created_by=str(item.get("created_by", "")),
-                                created_at=str(item.get("created_at", "")),
-                                last_run=str(item.get("last_run", "")),
-                                fire_at=str(item.get("fire_at", "")),
-                                enabled=bool(item.get("enabled", True)),
-                            )
-                            self._alarms[entry.alarm_id] = entry
+            if isinstance(raw, list):
+                for item in raw:
+                    if isinstance(item, dict) and "alarm_id" in item:
+                        entry = self._entry_from_dict(item)
+                        self._alarms[entry.alarm_id] = entry
         except Exception as e:
             _log(f"[AlarmScheduler:{self._bot_name}] load failed: {e}")
 
     def _save(self):
-        """Persist alarms to JSON file (atomic write via tmp + replace)."""
+        """Persist alarms via the storage port, or to JSON file (atomic write via tmp + replace)."""
+        data = [asdict(a) for a in self._alarms.values()]
+        if self._storage is not None:
+            try:
+                self._storage.save(self._storage_key, data)
+            except Exception as e:
+                _log(f"[AlarmScheduler:{self._bot_name}] save failed: {e}")
+            return
         try:
             self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-            data = [asdict(a) for a in self._alarms.values()]
             content = json.dumps(data, ensure_ascii=False, indent=2)
             # Atomic write: write to temp file in same directory, then replace
             fd, tmp_path = tempfile.mkstemp(
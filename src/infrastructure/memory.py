@@ -1,7 +1,9 @@
 """Memory management system."""
 
 import json
+import os
 import sys
+import tempfile
 import uuid
 from collections import Counter
 from datetime import datetime, timedelta
@@ -16,27 +18,85 @@ class SimpleMemory:
         self.memory_dir = Path(memory_dir)
         self.memory_dir.mkdir(exist_ok=True)
         self.max_decisions = 100
-        self.decisions_file = self.memory_dir / "decisions.json"
+        # One JSON object per line: add_decision appends instead of rewriting
+        self.decisions_file = self.memory_dir / "decisions.jsonl"
         self.summary_file = self.memory_dir / "summary.txt"
+        self._decision_count = None  # lazily counted on first add
+        self._message_index = None  # word set -> latest timestamp, built on first lookup
+        self._migrate_legacy_decisions()
+
+    def _migrate_legacy_decisions(self):
+        """Convert a decisions.json array from older versions to JSONL"""
+        legacy_file = self.memory_dir / "decisions.json"
+        if self.decisions_file.exists() or not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                decisions = json.load(f)
+            if not isinstance(decisions, list):
+                raise ValueError("decisions.json is not a list")
+            self._write_decisions(decisions)
+            # Only drop the old file once the JSONL file is in place
+            legacy_file.unlink()
+        except Exception as e:
+            print(f"Failed to migrate decisions: {e}", file=sys.stderr)
 
     def load_decisions(self) -> List[Dict[str, Any]]:
-        """Load decisions from JSON file"""
+        """Load decisions from JSONL file, skipping malformed lines"""
         if not self.decisions_file.exists():
             return []
+        decisions = []
         try:
             with open(self.decisions_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        decisions.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        print(f"Skipping malformed decision line {lineno}: {e}", file=sys.stderr)
         except Exception as e:
             print(f"Failed to load decisions: {e}", file=sys.stderr)
-            return []
+        return decisions
+
+    def _write_decisions(self, decisions: List[Dict[str, Any]]):
+        """Atomically replace the JSONL file (tmp + replace); raises on failure"""
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.memory_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(d, ensure_ascii=False) + "\n" for d in decisions)
+            os.replace(tmp_path, str(self.decisions_file))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def save_decisions(self, decisions: List[Dict[str, Any]]):
-        """Save decisions to JSON file"""
+        """Rewrite the JSONL file with the given decisions"""
+        try:
+            self._write_decisions(decisions)
+            self._decision_count = len(decisions)
+            self._message_index = None
+        except Exception as e:
+            print(f"Failed to save decisions: {e}", file=sys.stderr)
+
+    def _append_decision(self, decision: Dict[str, Any]) -> bool:
+        """Append one decision line to the JSONL file; returns False if the write failed"""
+        line = (json.dumps(decision, ensure_ascii=False) + "\n").encode("utf-8")
         try:
-            with open(self.decisions_file, "w", encoding="utf-8") as f:
-                json.dump(decisions, f, indent=2, ensure_ascii=False)
+            with open(self.decisions_file, "a+b") as f:
+                # Start on a fresh line if an earlier append was torn mid-line
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+            return True
         except Exception as e:
             print(f"Failed to save decisions: {e}", file=sys.stderr)
+            return False
 
     def load_summary(self) -> str:
         """Load summary from text file"""
@@ -56,7 +116,8 @@ class SimpleMemory:
 
     def add_decision(self, decision: Dict[str, Any]):
         """Add a new decision and auto-manage memory"""
-        decisions = self.load_decisions()
+        if self._decision_count is None:
+            self._decision_count = len(self.load_decisions())
 
         # Add new decision with metadata
         decision_entry = {
@@ -64,10 +125,19 @@ class SimpleMemory:
             "timestamp": datetime.now().isoformat(),
             **decision
         }
-        decisions.append(decision_entry)
-
-        # If exceeded max, create summary of old decisions
-        if len(decisions) > self.max_decisions:
+        if not self._append_decision(decision_entry):
+            return
+        self._decision_count += 1
+        if self._message_index is not None:
+            self._index_decision(decision_entry)
+
+        # If exceeded max, create summary of old decisions (the only full rewrite)
+        if self._decision_count > self.max_decisions:
+            decisions = self.load_decisions()
+            if len(decisions) <= self.max_decisions:
+                # Count drifted from what is readable on disk; never trim on it
+                self._decision_count = len(decisions)
+                return
             old_decisions = decisions[:50]
             decisions = decisions[50:]
 
@@ -75,8 +145,7 @@ class SimpleMemory:
             summary = self._create_summary(old_decisions)
             self.save_summary(summary)
             print(f"Created summary of {len(old_decisions)} old decisions", file=sys.stderr)
-
-        self.save_decisions(decisions)
+            self.save_decisions(decisions)
 
     def _create_summary(self, decisions: List[Dict[str, Any]]) -> str:
         """Create a simple text summary of decisions"""
@@ -117,15 +186,32 @@ class SimpleMemory:
 
     def should_skip_duplicate(self, message: str) -> bool:
         """Check if this message was sent recently (24h window)"""
-        decisions = self.load_decisions()
+        words = self._words(message)
+        if not words:
+            return False
         yesterday = datetime.now() - timedelta(days=1)
 
+        decisions = None
+        if self._message_index is None:
+            decisions = self.load_decisions()
+            self._message_index = {}
+            for d in decisions:
+                self._index_decision(d)
+
+        # Exact fast path: identical word sets have similarity 1.0
+        last_seen = self._message_index.get(words)
+        if last_seen is not None and last_seen > yesterday:
+            print(f"Skipping duplicate: '{message[:50]}...'", file=sys.stderr)
+            return True
+
+        if decisions is None:
+            decisions = self.load_decisions()
         for d in decisions:
             try:
                 decision_time = datetime.fromisoformat(d.get("timestamp", ""))
                 if decision_time > yesterday:
-                    prev_message = d.get("message", "")
-                    if self._similarity(message, prev_message) > 0.85:
+                    prev_words = self._words(d.get("message", ""))
+                    if self._jaccard(words, prev_words) > 0.85:
                         print(f"Skipping duplicate: '{message[:50]}...'", file=sys.stderr)
                         return True
             except Exception:
@@ -133,22 +219,32 @@ class SimpleMemory:
 
         return False
 
-    @staticmethod
-    def _similarity(a: str, b: str) -> float:
-        """Calculate simple word-based similarity"""
-        if not a or not b:
-            return 0.0
+    def _index_decision(self, decision: Dict[str, Any]):
+        """Record a decision's word set in the exact-duplicate index"""
+        try:
+            timestamp = datetime.fromisoformat(decision.get("timestamp", ""))
+            words = self._words(decision.get("message", ""))
+            if words and timestamp > self._message_index.get(words, datetime.min):
+                self._message_index[words] = timestamp
+        except Exception:
+            return
 
-        words_a = set(a.lower().split())
-        words_b = set(b.lower().split())
+    @staticmethod
+    def _words(text: str) -> frozenset:
+        """Lower-cased word set used for similarity checks"""
+        return frozenset(text.lower().split()) if text else frozenset()
 
+    @staticmethod
+    def _jaccard(words_a: frozenset, words_b: frozenset) -> float:
+        """Jaccard index of two word sets"""
         if not words_a or not words_b:
             return 0.0
+        return len(words_a & words_b) / len(words_a | words_b)
 
-        intersection = words_a & words_b
-        union = words_a | words_b
-
-        return len(intersection) / len(union)
+    @classmethod
+    def _similarity(cls, a: str, b: str) -> float:
+        """Calculate simple word-based similarity"""
+        return cls._jaccard(cls._words(a), cls._words(b))
 
 
 class GuardrailMemory(SimpleMemory):
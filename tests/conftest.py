@@ -0,0 +1,27 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.config import CONFIG
+from tests.helpers import build_bot, build_message
+
+
+@pytest.fixture(scope="session")
+def make_bot():
+    """Factory for BaseMarketingBot instances: ``make_bot(executor=..., tmp_path=...)``."""
+    return build_bot
+
+
+@pytest.fixture(scope="session")
+def make_message():
+    """Factory for fake messages: ``make_message(content, channel_id, is_bot=...)``."""
+    return build_message
+
+
+@pytest.fixture
+def set_config(monkeypatch):
+    """Override CONFIG keys in place: ``set_config({...})``; each key is restored after the test."""
+    def _set(values):
+        for key, value in values.items():
+            monkeypatch.setitem(CONFIG, key, value)
+    return _set
@@ -5,8 +5,10 @@ No discord import needed — tests use mock ports only.
 
 import asyncio
 import tempfile
+from contextlib import suppress
 
 import pytest
+import pytest_asyncio
 
 from src.domain.agent import AgentBrain
 from src.ports.inbound import IncomingMessage
@@ -56,8 +58,9 @@ def _make_brain(
     clients=None,
     own_channel_id=100,
     team_channel_ids=None,
+    storage_dir=None,
 ):
-    tmp = tempfile.mkdtemp()
+    tmp = storage_dir or tempfile.mkdtemp()
     llm = MockLLM(response=llm_response)
     notification = MockNotification()
     brain = AgentBrain(
@@ -96,6 +99,30 @@ def _make_msg(
     )
 
 
+@pytest.fixture(scope="class")
+def action_brain(tmp_path_factory):
+    """One brain shared by a test class — reset per test via ``_reset_brain``."""
+    return _make_brain(storage_dir=str(tmp_path_factory.mktemp("act")))
+
+
+@pytest.fixture(scope="class")
+def instagram_brain(tmp_path_factory):
+    return _make_brain(
+        clients={"instagram": object()},
+        storage_dir=str(tmp_path_factory.mktemp("act_ig")),
+    )
+
+
+@pytest_asyncio.fixture
+async def parked_task():
+    """A task blocked on an event that never fires — cancelled on teardown."""
+    task = asyncio.create_task(asyncio.Event().wait())
+    yield task
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
 # --- Tests ---
 
 
@@ -192,18 +219,14 @@ class TestCommands:
 
 class TestCancelTasks:
     @pytest.mark.asyncio
-    async def test_cancel_own_tasks(self):
+    async def test_cancel_own_tasks(self, parked_task):
         brain, _, _ = _make_brain()
-
-        async def _dummy():
-            await asyncio.sleep(9999)
-
-        task = asyncio.create_task(_dummy())
-        brain._active_tasks[100] = task
+        brain._active_tasks[100] = parked_task
         count = brain.cancel_own_tasks()
         assert count == 1
-        await asyncio.sleep(0)  # let cancellation propagate
-        assert task.cancelled()
+        with suppress(asyncio.CancelledError):
+            await parked_task
+        assert parked_task.cancelled()
 
     def test_cancel_no_tasks(self):
         brain, _, _ = _make_brain()
@@ -248,43 +271,49 @@ class TestHistory:
 
 
 class TestActionExecution:
+    @pytest.fixture(autouse=True)
+    def _reset_brain(self, action_brain):
+        brain, _, _ = action_brain
+        brain._channel_history.clear()
+        brain._alarm_scheduler._alarms.clear()
+
     @pytest.mark.asyncio
-    async def test_unknown_action(self):
-        brain, _, _ = _make_brain()
+    async def test_unknown_action(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("UNKNOWN_ACTION", "body")
         assert "알 수 없는 액션" in result
 
     @pytest.mark.asyncio
-    async def test_empty_body_rejected(self):
-        brain, _, _ = _make_brain()
+    async def test_empty_body_rejected(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("POST_X", "")
         assert "비어있음" in result
 
     @pytest.mark.asyncio
-    async def test_no_client_for_platform(self):
-        brain, _, _ = _make_brain(clients={})
+    async def test_no_client_for_platform(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("POST_X", "tweet text")
         assert "연결되지 않았음" in result
 
     @pytest.mark.asyncio
-    async def test_set_alarm_missing_schedule(self):
-        brain, _, _ = _make_brain()
+    async def test_set_alarm_missing_schedule(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action(
             "SET_ALARM", "prompt: hello", channel_id=100, author="user"
         )
         assert "schedule 필드 누락" in result
 
     @pytest.mark.asyncio
-    async def test_set_alarm_missing_prompt(self):
-        brain, _, _ = _make_brain()
+    async def test_set_alarm_missing_prompt(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action(
             "SET_ALARM", "schedule: daily 09:00", channel_id=100, author="user"
         )
         assert "prompt 필드 누락" in result
 
     @pytest.mark.asyncio
-    async def test_set_alarm_success(self):
-        brain, _, _ = _make_brain()
+    async def test_set_alarm_success(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action(
             "SET_ALARM",
             "schedule: daily 09:00\nprompt: morning briefing",
@@ -295,32 +324,32 @@ class TestActionExecution:
         assert "매일 09:00" in result
 
     @pytest.mark.asyncio
-    async def test_cancel_alarm_not_found(self):
-        brain, _, _ = _make_brain()
+    async def test_cancel_alarm_not_found(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("CANCEL_ALARM", "nonexistent_id")
         assert "찾을 수 없음" in result
 
     @pytest.mark.asyncio
-    async def test_set_alarm_no_context(self):
-        brain, _, _ = _make_brain()
+    async def test_set_alarm_no_context(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("SET_ALARM", "schedule: daily 09:00\nprompt: hi")
         assert "메시지 컨텍스트 없음" in result
 
     @pytest.mark.asyncio
-    async def test_search_no_client(self):
-        brain, _, _ = _make_brain()
+    async def test_search_no_client(self, action_brain):
+        brain, _, _ = action_brain
         result = await brain.execute_action("SEARCH_NEWS", "query")
         assert "연결되지 않았음" in result
 
     @pytest.mark.asyncio
-    async def test_instagram_empty_caption(self):
-        brain, _, _ = _make_brain(clients={"instagram": object()})
+    async def test_instagram_empty_caption(self, instagram_brain):
+        brain, _, _ = instagram_brain
         result = await brain.execute_action("POST_INSTAGRAM", "image_url: https://x.com/img.jpg")
         assert "캡션이 비어있음" in result
 
     @pytest.mark.asyncio
-    async def test_instagram_ssrf_prevention(self):
-        brain, _, _ = _make_brain(clients={"instagram": object()})
+    async def test_instagram_ssrf_prevention(self, instagram_brain):
+        brain, _, _ = instagram_brain
         result = await brain.execute_action(
             "POST_INSTAGRAM", "caption here\nimage_url: http://evil.com/img.jpg"
         )
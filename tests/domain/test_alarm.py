@@ -1,14 +1,14 @@
 """Tests for alarm domain logic with mock storage.
 
 These tests verify AlarmScheduler behavior without filesystem dependency
-(using temp dirs for isolation).
+(alarms persist to an in-memory StoragePort).
 """
 
-import tempfile
 from datetime import datetime, timezone
 
 import pytest
 
+from src.adapters.storage.memory_store import MemoryStorage
 from src.domain.alarm import AlarmScheduler
 
 
@@ -17,8 +17,7 @@ class TestAlarmSchedulerDomain:
 
     @pytest.fixture
     def scheduler(self):
-        tmp = tempfile.mkdtemp()
-        return AlarmScheduler(bot_name="test", storage_dir=tmp)
+        return AlarmScheduler(bot_name="test", storage=MemoryStorage())
 
     def test_add_and_list(self, scheduler):
         entry = scheduler.add_alarm(
@@ -0,0 +1,72 @@
+"""Test doubles shared by conftest.py fixtures and test modules."""
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from src.adapters.discord.base_bot import BaseMarketingBot
+from src.adapters.storage.memory_store import MemoryStorage
+from src.domain.alarm import AlarmScheduler
+
+
+OWN_CHANNEL = 100
+TEAM_CHANNEL = 200
+BOT_USER_ID = 999
+
+
+class _NoClientInit(discord.Client):
+    """Stands in for discord.Client.__init__ (ConnectionState, HTTP client, ...)."""
+
+    def __init__(self, **kwargs):
+        pass
+
+
+class _TestBot(BaseMarketingBot, _NoClientInit):
+    """BaseMarketingBot whose super().__init__ resolves to _NoClientInit.
+
+    Unit tests only touch self.user (via _connection, faked below) and
+    get_channel (patched per test), so the discord client state is never needed.
+    """
+
+
+def build_bot(executor=None, tmp_path=None) -> BaseMarketingBot:
+    """Create a BaseMarketingBot with a fake self.user.
+
+    Alarms live in MemoryStorage unless ``tmp_path`` is given — pass it only
+    when a test verifies on-disk persistence.
+    """
+    bot = _TestBot(
+        bot_name="TestBot",
+        persona="You are a test bot.",
+        own_channel_id=OWN_CHANNEL,
+        team_channel_id=TEAM_CHANNEL,
+        executor=executor,
+    )
+    if tmp_path:
+        bot._alarm_scheduler = AlarmScheduler(bot_name="TestBot", storage_dir=str(tmp_path))
+    else:
+        bot._alarm_scheduler = AlarmScheduler(bot_name="TestBot", storage=MemoryStorage())
+    # Fake self.user — discord.Client exposes user via _connection.user
+    bot._connection = MagicMock()
+    bot._connection.user = SimpleNamespace(
+        id=BOT_USER_ID, name="TestBot", display_name="TestBot",
+        mentioned_in=lambda message: False,
+    )
+    return bot
+
+
+class _Author(SimpleNamespace):
+    def __str__(self):
+        return f"user#{self.id}"
+
+
+def build_message(content: str, channel_id: int, *, is_bot: bool = False) -> SimpleNamespace:
+    """Fake discord.Message — plain attributes, AsyncMock only where awaited."""
+    return SimpleNamespace(
+        content=content,
+        channel=SimpleNamespace(id=channel_id, send=AsyncMock(), typing=nullcontext),
+        author=_Author(bot=is_bot, id=1234 if not is_bot else 5678),
+        role_mentions=[],
+    )
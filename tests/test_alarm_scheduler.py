@@ -2,19 +2,28 @@
 
 import json
 import os
-import tempfile
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import pytest
 
+from src.adapters.storage.memory_store import MemoryStorage
 from src.domain.alarm import AlarmScheduler, _MIN_INTERVAL_MINUTES, _MAX_ALARMS_PER_BOT
 
 
+@pytest.fixture(scope="module")
+def seoul():
+    """Asia/Seoul zone; only the tests that need it skip when tzdata is missing."""
+    try:
+        return ZoneInfo("Asia/Seoul")
+    except ZoneInfoNotFoundError:
+        pytest.skip("tzdata for Asia/Seoul is not available")
+
+
 @pytest.fixture
-def tmp_dir():
-    """Create a temporary directory for alarm storage."""
-    with tempfile.TemporaryDirectory() as d:
-        yield d
+def tmp_dir(tmp_path):
+    """Temporary directory for alarm storage."""
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -22,71 +31,77 @@ def scheduler(tmp_dir):
     return AlarmScheduler(bot_name="TestBot", storage_dir=tmp_dir)
 
 
+@pytest.fixture(scope="module")
+def parse_scheduler(tmp_path_factory):
+    """Shared scheduler for stateless parsing tests."""
+    return AlarmScheduler(bot_name="TestBot", storage_dir=str(tmp_path_factory.mktemp("parse")))
+
+
 # ---------------------------------------------------------------------------
 # Schedule parsing
 # ---------------------------------------------------------------------------
 
 class TestParseSchedule:
-    def test_daily(self, scheduler):
-        result = scheduler._parse_schedule("daily 09:00")
+    def test_daily(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("daily 09:00")
         assert result == {"type": "daily", "hour": 9, "minute": 0}
 
-    def test_daily_afternoon(self, scheduler):
-        result = scheduler._parse_schedule("daily 14:30")
+    def test_daily_afternoon(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("daily 14:30")
         assert result == {"type": "daily", "hour": 14, "minute": 30}
 
-    def test_weekday(self, scheduler):
-        result = scheduler._parse_schedule("weekday 09:00")
+    def test_weekday(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("weekday 09:00")
         assert result == {"type": "weekday", "hour": 9, "minute": 0}
 
-    def test_every_hours(self, scheduler):
-        result = scheduler._parse_schedule("every 2h")
+    def test_every_hours(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("every 2h")
         assert result == {"type": "interval", "interval_minutes": 120}
 
-    def test_every_minutes(self, scheduler):
-        result = scheduler._parse_schedule("every 30m")
+    def test_every_minutes(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("every 30m")
         assert result == {"type": "interval", "interval_minutes": 30}
 
-    def test_case_insensitive(self, scheduler):
-        result = scheduler._parse_schedule("Daily 09:00")
+    def test_case_insensitive(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("Daily 09:00")
         assert result["type"] == "daily"
 
-    def test_invalid_format(self, scheduler):
+    def test_invalid_format(self, parse_scheduler):
         with pytest.raises(ValueError, match="잘못된 스케줄 형식"):
-            scheduler._parse_schedule("weekly 09:00")
+            parse_scheduler._parse_schedule("weekly 09:00")
 
-    def test_invalid_hour(self, scheduler):
+    def test_invalid_hour(self, parse_scheduler):
         with pytest.raises(ValueError, match="잘못된 시간"):
-            scheduler._parse_schedule("daily 25:00")
+            parse_scheduler._parse_schedule("daily 25:00")
 
-    def test_invalid_minute(self, scheduler):
+    def test_invalid_minute(self, parse_scheduler):
         with pytest.raises(ValueError, match="잘못된 시간"):
-            scheduler._parse_schedule("daily 09:61")
+            parse_scheduler._parse_schedule("daily 09:61")
 
-    def test_interval_too_short(self, scheduler):
+    def test_interval_too_short(self, parse_scheduler):
         with pytest.raises(ValueError, match="최소 간격"):
-            scheduler._parse_schedule("every 5m")
+            parse_scheduler._parse_schedule("every 5m")
 
-    def test_interval_hours_too_short(self, scheduler):
+    def test_interval_hours_too_short(self, parse_scheduler):
         """0h → 0 minutes, below minimum."""
         with pytest.raises(ValueError):
-            scheduler._parse_schedule("every 0h")
+            parse_scheduler._parse_schedule("every 0h")
 
-    def test_once_hours(self, scheduler):
-        result = scheduler._parse_schedule("once 1h")
+    def test_once_hours(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("once 1h")
         assert result == {"type": "once", "interval_minutes": 60}
 
-    def test_once_minutes(self, scheduler):
-        result = scheduler._parse_schedule("once 30m")
+    def test_once_minutes(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("once 30m")
         assert result == {"type": "once", "interval_minutes": 30}
 
-    def test_once_case_insensitive(self, scheduler):
-        result = scheduler._parse_schedule("Once 2H")
+    def test_once_case_insensitive(self, parse_scheduler):
+        result = parse_scheduler._parse_schedule("Once 2H")
         assert result["type"] == "once"
 
-    def test_once_too_short(self, scheduler):
+    def test_once_too_short(self, parse_scheduler):
         with pytest.raises(ValueError, match="최소 간격"):
-            scheduler._parse_schedule("once 5m")
+            parse_scheduler._parse_schedule("once 5m")
 
 
 # ---------------------------------------------------------------------------
@@ -119,7 +134,9 @@ class TestCRUD:
     def test_remove_nonexistent(self, scheduler):
         assert scheduler.remove_alarm("nonexist") is False
 
-    def test_max_alarms_limit(self, scheduler):
+    def test_max_alarms_limit(self):
+        # In-memory storage: the bulk insert needs no file rewrite per alarm.
+        scheduler = AlarmScheduler(bot_name="TestBot", storage=MemoryStorage())
         for i in range(_MAX_ALARMS_PER_BOT):
             scheduler.add_alarm("daily 09:00", f"p{i}", i, "u")
         with pytest.raises(ValueError, match="알람 개수 제한"):
@@ -135,11 +152,9 @@ class TestCRUD:
 # ---------------------------------------------------------------------------
 
 class TestGetDueAlarms:
-    def test_daily_due(self, scheduler):
+    def test_daily_due(self, scheduler, seoul):
         entry = scheduler.add_alarm("daily 09:00", "test", 1, "u", tz="Asia/Seoul")
         # Simulate: 9:01 AM in Seoul
-        from zoneinfo import ZoneInfo
-        seoul = ZoneInfo("Asia/Seoul")
         now_seoul = datetime.now(seoul).replace(hour=9, minute=1, second=0)
         now_utc = now_seoul.astimezone(timezone.utc)
 
@@ -147,20 +162,16 @@ class TestGetDueAlarms:
         assert len(due) == 1
         assert due[0].alarm_id == entry.alarm_id
 
-    def test_daily_not_yet(self, scheduler):
+    def test_daily_not_yet(self, scheduler, seoul):
         scheduler.add_alarm("daily 09:00", "test", 1, "u", tz="Asia/Seoul")
-        from zoneinfo import ZoneInfo
-        seoul = ZoneInfo("Asia/Seoul")
         now_seoul = datetime.now(seoul).replace(hour=8, minute=59, second=0)
         now_utc = now_seoul.astimezone(timezone.utc)
 
         due = scheduler.get_due_alarms(now_utc)
         assert len(due) == 0
 
-    def test_daily_already_ran_today(self, scheduler):
+    def test_daily_already_ran_today(self, scheduler, seoul):
         entry = scheduler.add_alarm("daily 09:00", "test", 1, "u", tz="Asia/Seoul")
-        from zoneinfo import ZoneInfo
-        seoul = ZoneInfo("Asia/Seoul")
         now_seoul = datetime.now(seoul).replace(hour=10, minute=0, second=0)
         now_utc = now_seoul.astimezone(timezone.utc)
 
@@ -300,6 +311,19 @@ class TestPersistence:
         assert alarms[0].schedule_type == "once"
         assert alarms[0].interval_minutes == 120
 
+    def test_storage_port_roundtrip(self):
+        """An injected StoragePort replaces file persistence entirely."""
+        storage = MemoryStorage()
+        s1 = AlarmScheduler(bot_name="MemBot", storage=storage)
+        entry = s1.add_alarm("daily 09:00", "morning news", 100, "alice", tz="UTC")
+
+        assert [d["alarm_id"] for d in storage.load("alarms_MemBot")] == [entry.alarm_id]
+        s2 = AlarmScheduler(bot_name="MemBot", storage=storage)
+        assert [a.alarm_id for a in s2.list_alarms()] == [entry.alarm_id]
+
+        s2.remove_alarm(entry.alarm_id)
+        assert storage.load("alarms_MemBot") == []
+
     def test_load_corrupted_file(self, tmp_dir):
         """Scheduler should handle corrupted JSON gracefully."""
         path = os.path.join(tmp_dir, "alarms_CorruptBot.json")
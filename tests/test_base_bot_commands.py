@@ -1,58 +1,12 @@
 """Tests for BaseMarketingBot command handlers (!cancel, !clear, !help)."""
 
-import asyncio
-from collections import OrderedDict
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.adapters.discord.base_bot import BaseMarketingBot
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-OWN_CHANNEL = 100
-TEAM_CHANNEL = 200
-BOT_USER_ID = 999
-
-
-def _make_bot(executor=None) -> BaseMarketingBot:
-    """Create a BaseMarketingBot with minimal config and a fake self.user."""
-    bot = BaseMarketingBot(
-        bot_name="TestBot",
-        persona="You are a test bot.",
-        own_channel_id=OWN_CHANNEL,
-        team_channel_id=TEAM_CHANNEL,
-        executor=executor,
-    )
-    # Fake self.user — discord.Client exposes user via _connection.user
-    fake_user = MagicMock()
-    fake_user.id = BOT_USER_ID
-    fake_user.name = "TestBot"
-    fake_user.display_name = "TestBot"
-    fake_user.mentioned_in = MagicMock(return_value=False)
-    bot._connection = MagicMock()
-    bot._connection.user = fake_user
-    return bot
-
-
-def _make_message(content: str, channel_id: int, *, is_bot: bool = False,
-                  mention_bot: bool = False) -> MagicMock:
-    """Create a fake discord.Message."""
-    msg = MagicMock()
-    msg.content = content
-    msg.channel = MagicMock()
-    msg.channel.id = channel_id
-    msg.channel.send = AsyncMock()
-    msg.channel.typing = MagicMock(return_value=AsyncMock(
-        __aenter__=AsyncMock(), __aexit__=AsyncMock(),
-    ))
-    msg.author = MagicMock()
-    msg.author.bot = is_bot
-    msg.author.id = 1234 if not is_bot else 5678
-    return msg
+from tests.helpers import BOT_USER_ID, OWN_CHANNEL, TEAM_CHANNEL
 
 
 # ---------------------------------------------------------------------------
@@ -60,12 +14,12 @@ def _make_message(content: str, channel_id: int, *, is_bot: bool = False,
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_clear_current_channel_only():
-    bot = _make_bot()
+async def test_clear_current_channel_only(make_bot, make_message):
+    bot = make_bot()
     bot._channel_history[OWN_CHANNEL] = [{"role": "user", "text": "hi"}]
     bot._channel_history[TEAM_CHANNEL] = [{"role": "user", "text": "hello"}]
 
-    msg = _make_message("!clear", OWN_CHANNEL)
+    msg = make_message("!clear", OWN_CHANNEL)
     await bot.on_message(msg)
 
     # Own channel cleared
@@ -76,18 +30,15 @@ async def test_clear_current_channel_only():
     assert "이 채널" in msg.channel.send.call_args[0][0]
 
 
-@pytest.mark.asyncio
-async def test_clear_all_channels():
-    bot = _make_bot()
+def test_clear_all_channels(make_bot, make_message):
+    bot = make_bot()
     bot._channel_history[OWN_CHANNEL] = [{"role": "user", "text": "hi"}]
     bot._channel_history[TEAM_CHANNEL] = [{"role": "user", "text": "hello"}]
 
-    msg = _make_message("!clear all", OWN_CHANNEL)
-    await bot.on_message(msg)
+    text = bot._clear_history(make_message("!clear all", OWN_CHANNEL))
 
     assert len(bot._channel_history) == 0
-    msg.channel.send.assert_awaited_once()
-    assert "전체" in msg.channel.send.call_args[0][0]
+    assert "전체" in text
 
 
 # ---------------------------------------------------------------------------
@@ -95,10 +46,10 @@ async def test_clear_all_channels():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_cancel_active_task():
+async def test_cancel_active_task(make_bot, make_message):
     """!cancel should cancel a running task; _respond sends the cancellation message."""
     executor = MagicMock()
-    bot = _make_bot(executor=executor)
+    bot = make_bot(executor=executor)
 
     # Simulate an active, non-done task
     fake_task = MagicMock()
@@ -106,7 +57,7 @@ async def test_cancel_active_task():
     fake_task.cancel = MagicMock()
     bot._active_tasks[OWN_CHANNEL] = fake_task
 
-    msg = _make_message("!cancel", OWN_CHANNEL)
+    msg = make_message("!cancel", OWN_CHANNEL)
     await bot.on_message(msg)
 
     fake_task.cancel.assert_called_once()
@@ -115,10 +66,10 @@ async def test_cancel_active_task():
 
 
 @pytest.mark.asyncio
-async def test_cancel_no_active_task_own_channel():
+async def test_cancel_no_active_task_own_channel(make_bot, make_message):
     """!cancel in 1:1 channel with no active task → inform user."""
-    bot = _make_bot()
-    msg = _make_message("!cancel", OWN_CHANNEL)
+    bot = make_bot()
+    msg = make_message("!cancel", OWN_CHANNEL)
     await bot.on_message(msg)
 
     msg.channel.send.assert_awaited_once()
@@ -126,10 +77,10 @@ async def test_cancel_no_active_task_own_channel():
 
 
 @pytest.mark.asyncio
-async def test_cancel_no_active_task_team_channel_silent():
+async def test_cancel_no_active_task_team_channel_silent(make_bot, make_message):
     """!cancel in team channel with no active task → silence (no 5-bot noise)."""
-    bot = _make_bot()
-    msg = _make_message("!cancel", TEAM_CHANNEL)
+    bot = make_bot()
+    msg = make_message("!cancel", TEAM_CHANNEL)
     await bot.on_message(msg)
 
     msg.channel.send.assert_not_awaited()
@@ -139,17 +90,22 @@ async def test_cancel_no_active_task_team_channel_silent():
 # !help test
 # ---------------------------------------------------------------------------
 
+def test_help_lists_commands(make_bot):
+    text = make_bot()._help_text()
+    assert "!cancel" in text
+    assert "!clear" in text
+    assert "!help" in text
+
+
 @pytest.mark.asyncio
-async def test_help_in_own_channel():
-    bot = _make_bot()
-    msg = _make_message("!help", OWN_CHANNEL)
+async def test_help_own_channel_sends_reply(make_bot, make_message):
+    """!help in the bot's own channel is routed to _handle_help."""
+    bot = make_bot()
+    msg = make_message("!help", OWN_CHANNEL)
     await bot.on_message(msg)
 
     msg.channel.send.assert_awaited_once()
-    text = msg.channel.send.call_args[0][0]
-    assert "!cancel" in text
-    assert "!clear" in text
-    assert "!help" in text
+    assert "명령어 목록" in msg.channel.send.call_args[0][0]
 
 
 # ---------------------------------------------------------------------------
@@ -157,11 +113,11 @@ async def test_help_in_own_channel():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_bot_author_commands_ignored():
+async def test_bot_author_commands_ignored(make_bot, make_message):
     """Commands from other bots should be ignored entirely."""
-    bot = _make_bot()
+    bot = make_bot()
     for cmd in ("!cancel", "!clear", "!help"):
-        msg = _make_message(cmd, OWN_CHANNEL, is_bot=True)
+        msg = make_message(cmd, OWN_CHANNEL, is_bot=True)
         await bot.on_message(msg)
         msg.channel.send.assert_not_awaited()
 
@@ -171,12 +127,12 @@ async def test_bot_author_commands_ignored():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_clear_team_channel_without_mention_silent():
+async def test_clear_team_channel_without_mention_silent(make_bot, make_message):
     """!clear in team channel without mention → clears silently (no message)."""
-    bot = _make_bot()
+    bot = make_bot()
     bot._channel_history[TEAM_CHANNEL] = [{"role": "user", "text": "hi"}]
 
-    msg = _make_message("!clear", TEAM_CHANNEL)
+    msg = make_message("!clear", TEAM_CHANNEL)
     await bot.on_message(msg)
 
     # History should be cleared silently
@@ -185,10 +141,10 @@ async def test_clear_team_channel_without_mention_silent():
 
 
 @pytest.mark.asyncio
-async def test_help_team_channel_without_mention_ignored():
+async def test_help_team_channel_without_mention_ignored(make_bot, make_message):
     """!help in team channel without mention → non-TeamLead bots stay silent."""
-    bot = _make_bot()  # bot_name="TestBot", not TeamLead
-    msg = _make_message("!help", TEAM_CHANNEL)
+    bot = make_bot()  # bot_name="TestBot", not TeamLead
+    msg = make_message("!help", TEAM_CHANNEL)
     await bot.on_message(msg)
 
     msg.channel.send.assert_not_awaited()
@@ -199,10 +155,10 @@ async def test_help_team_channel_without_mention_ignored():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_concurrent_tasks_no_orphan():
+async def test_concurrent_tasks_no_orphan(make_bot):
     """When task2 overwrites task1 in _active_tasks, task1's finally must not evict task2."""
     executor = MagicMock()
-    bot = _make_bot(executor=executor)
+    bot = make_bot(executor=executor)
 
     task1 = MagicMock()
     task2 = MagicMock()
@@ -227,37 +183,37 @@ async def test_concurrent_tasks_no_orphan():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_cancel_sets_suppress_flag():
+async def test_cancel_sets_suppress_flag(make_bot, make_message):
     """!cancel should set _suppress_bot_replies flag."""
-    bot = _make_bot()
+    bot = make_bot()
     fake_task = MagicMock()
     fake_task.done.return_value = False
     fake_task.cancel = MagicMock()
     bot._active_tasks[OWN_CHANNEL] = fake_task
 
-    msg = _make_message("!cancel", OWN_CHANNEL)
+    msg = make_message("!cancel", OWN_CHANNEL)
     await bot.on_message(msg)
 
     assert bot._suppress_bot_replies is True
 
 
 @pytest.mark.asyncio
-async def test_cancel_all_sets_suppress_flag():
+async def test_cancel_all_sets_suppress_flag(make_bot, make_message):
     """!cancel all should set _suppress_bot_replies flag."""
-    bot = _make_bot()
-    msg = _make_message("!cancel all", OWN_CHANNEL)
+    bot = make_bot()
+    msg = make_message("!cancel all", OWN_CHANNEL)
     await bot.on_message(msg)
 
     assert bot._suppress_bot_replies is True
 
 
 @pytest.mark.asyncio
-async def test_suppress_cleared_on_human_message():
+async def test_suppress_cleared_on_human_message(make_bot, make_message):
     """Human message should clear _suppress_bot_replies flag."""
-    bot = _make_bot(executor=MagicMock())
+    bot = make_bot(executor=MagicMock())
     bot._suppress_bot_replies = True
 
-    msg = _make_message("안녕", OWN_CHANNEL)
+    msg = make_message("안녕", OWN_CHANNEL)
     # Mock _respond to avoid full LLM execution
     bot._respond = AsyncMock()
     await bot.on_message(msg)
@@ -266,13 +222,13 @@ async def test_suppress_cleared_on_human_message():
 
 
 @pytest.mark.asyncio
-async def test_bot_message_suppressed_after_cancel():
+async def test_bot_message_suppressed_after_cancel(make_bot, make_message):
     """Bot messages should be suppressed when _suppress_bot_replies is True."""
-    bot = _make_bot()
+    bot = make_bot()
     bot._suppress_bot_replies = True
 
     # Simulate a bot message mentioning this bot in team channel
-    msg = _make_message(f"<@{BOT_USER_ID}> 결과입니다", TEAM_CHANNEL, is_bot=True)
+    msg = make_message(f"<@{BOT_USER_ID}> 결과입니다", TEAM_CHANNEL, is_bot=True)
     msg.author.mentioned_in = MagicMock(return_value=False)
 
     # Patch user.mentioned_in to return True for this message
@@ -297,12 +253,10 @@ def test_alias_text_mention():
         team_channel_id=TEAM_CHANNEL,
         aliases=["NewsBot"],
     )
-    fake_user = MagicMock()
-    fake_user.id = BOT_USER_ID
-    fake_user.name = "ResearcherBot"
-    fake_user.display_name = "ResearcherBot"
     bot._connection = MagicMock()
-    bot._connection.user = fake_user
+    bot._connection.user = SimpleNamespace(
+        id=BOT_USER_ID, name="ResearcherBot", display_name="ResearcherBot",
+    )
 
     assert bot._is_text_mentioned("@NewsBot 조사해줘")
     assert bot._is_text_mentioned("@newsbot 조사해줘")
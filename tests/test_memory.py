@@ -1,64 +1,97 @@
 """Tests for memory management system"""
 
+import json
 import pytest
-import tempfile
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from src.infrastructure.memory import SimpleMemory, GuardrailMemory
 
 
+@pytest.fixture
+def memory_dir(tmp_path):
+    return str(tmp_path)
+
+
 class TestSimpleMemory:
     """Test SimpleMemory class"""
 
-    def test_initialization(self):
+    def test_initialization(self, memory_dir):
         """Test memory initialization"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = SimpleMemory(memory_dir=tmpdir)
-            assert memory.memory_dir.exists()
-            assert memory.max_decisions == 100
+        memory = SimpleMemory(memory_dir=memory_dir)
+        assert memory.memory_dir.exists()
+        assert memory.max_decisions == 100
 
-    def test_add_and_load_decision(self):
+    def test_add_and_load_decision(self, memory_dir):
         """Test adding and loading decisions"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = SimpleMemory(memory_dir=tmpdir)
+        memory = SimpleMemory(memory_dir=memory_dir)
 
-            decision = {
-                "action": "notify",
-                "message": "Test message",
-                "reasoning": "Testing"
-            }
+        decision = {
+            "action": "notify",
+            "message": "Test message",
+            "reasoning": "Testing"
+        }
 
-            memory.add_decision(decision)
-            decisions = memory.load_decisions()
+        memory.add_decision(decision)
+        decisions = memory.load_decisions()
 
-            assert len(decisions) == 1
-            assert decisions[0]["action"] == "notify"
-            assert decisions[0]["message"] == "Test message"
-            assert "id" in decisions[0]
-            assert "timestamp" in decisions[0]
+        assert len(decisions) == 1
+        assert decisions[0]["action"] == "notify"
+        assert decisions[0]["message"] == "Test message"
+        assert "id" in decisions[0]
+        assert "timestamp" in decisions[0]
 
-    def test_duplicate_detection(self):
+    def test_duplicate_detection(self, memory_dir):
         """Test duplicate message detection"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = SimpleMemory(memory_dir=tmpdir)
+        memory = SimpleMemory(memory_dir=memory_dir)
 
-            decision = {
-                "action": "notify",
-                "message": "Test message for duplicate",
-                "reasoning": "Testing duplicates"
-            }
+        decision = {
+            "action": "notify",
+            "message": "Test message for duplicate",
+            "reasoning": "Testing duplicates"
+        }
 
-            memory.add_decision(decision)
+        memory.add_decision(decision)
+
+        # Should detect duplicate
+        assert memory.should_skip_duplicate("Test message for duplicate")
+
+        # Should not detect different message
+        assert not memory.should_skip_duplicate("Completely different message")
+
+    def test_exact_duplicate_skips_similarity_scan(self, memory_dir, monkeypatch):
+        """Same word set is caught by the index before any _jaccard call"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.add_decision({"action": "notify", "message": "Launch day post"})
+        assert not memory.should_skip_duplicate("unrelated text")  # builds the index
+
+        def _no_scan(*_):
+            raise AssertionError("similarity scan should not run")
 
-            # Should detect duplicate
-            assert memory.should_skip_duplicate("Test message for duplicate")
+        monkeypatch.setattr(SimpleMemory, "_jaccard", staticmethod(_no_scan))
+        assert memory.should_skip_duplicate("post LAUNCH day")
 
-            # Should not detect different message
-            assert not memory.should_skip_duplicate("Completely different message")
+    def test_exact_duplicate_outside_window(self, memory_dir):
+        """Index hits older than 24h are not duplicates"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+        old = (datetime.now() - timedelta(days=2)).isoformat()
+        memory.save_decisions([{"timestamp": old, "action": "notify", "message": "Launch day post"}])
+
+        assert not memory.should_skip_duplicate("Launch day post")
+
+    def test_malformed_decision_ignored(self, memory_dir):
+        """Odd stored decisions are skipped rather than failing the check"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.save_decisions([
+            {"timestamp": "2024-01-01T00:00:00+09:00", "message": "aware timestamp"},
+            {"timestamp": datetime.now().isoformat(), "message": 42},
+        ])
+
+        assert not memory.should_skip_duplicate("Launch day post")
 
     def test_similarity_calculation(self):
         """Test word-based similarity"""
-        memory = SimpleMemory()
+        memory = SimpleMemory  # _similarity needs no instance (or memory/ dir)
 
         # High similarity
         assert memory._similarity("hello world", "hello world") == 1.0
@@ -71,110 +104,184 @@ class TestSimpleMemory:
         # No similarity
         assert memory._similarity("hello", "world") == 0.0
 
-    def test_auto_summarization(self):
+    def test_auto_summarization(self, memory_dir):
         """Test auto-summarization when limit exceeded"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = SimpleMemory(memory_dir=tmpdir)
-            memory.max_decisions = 10  # Lower limit for testing
-
-            # Add 15 decisions
-            for i in range(15):
-                decision = {
-                    "action": "notify",
-                    "message": f"Message {i}",
-                    "reasoning": "Testing"
-                }
-                memory.add_decision(decision)
-
-            # Should have trimmed to 10 and created summary
-            decisions = memory.load_decisions()
-            assert len(decisions) <= 10
-
-            summary = memory.load_summary()
-            assert "Summary" in summary
-
-    def test_get_context(self):
-        """Test getting context for AI"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = SimpleMemory(memory_dir=tmpdir)
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.max_decisions = 10  # Lower limit for testing
 
+        # Add 15 decisions
+        for i in range(15):
             decision = {
                 "action": "notify",
-                "message": "Test context",
-                "reasoning": "Testing context"
+                "message": f"Message {i}",
+                "reasoning": "Testing"
             }
-
             memory.add_decision(decision)
-            context = memory.get_context()
 
-            assert "Recent Activity" in context
-            assert "Test context" in context
+        # Should have trimmed to 10 and created summary
+        decisions = memory.load_decisions()
+        assert len(decisions) <= 10
+
+        summary = memory.load_summary()
+        assert "Summary" in summary
+
+    def test_decisions_appended_as_jsonl(self, memory_dir):
+        """Each decision is one appended JSON line"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+
+        memory.add_decision({"action": "notify", "message": "first"})
+        memory.add_decision({"action": "notify", "message": "second"})
+
+        lines = memory.decisions_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["message"] == "second"
+
+    def test_corrupt_line_keeps_valid_decisions(self, memory_dir):
+        """A torn line is skipped; load, duplicate check and trim keep the rest"""
+        now = datetime.now().isoformat()
+        lines = [json.dumps({"timestamp": now, "action": "notify", "message": f"Message {i}"})
+                 for i in range(55)]
+        decisions_file = Path(memory_dir) / "decisions.jsonl"
+        decisions_file.write_text("\n".join(lines) + '\n{"timestamp": "2', encoding="utf-8")
+
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.max_decisions = 55
+        assert len(memory.load_decisions()) == 55
+        assert memory.should_skip_duplicate("Message 3")
+
+        memory.add_decision({"action": "notify", "message": "after the tear"})
+
+        remaining = [d["message"] for d in memory.load_decisions()]
+        assert remaining == [f"Message {i}" for i in range(50, 55)] + ["after the tear"]
+        assert "Summary of 50 decisions" in memory.load_summary()
+
+    def test_failed_append_not_counted(self, memory_dir, monkeypatch):
+        """A decision that was never written is neither counted nor indexed"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.add_decision({"action": "notify", "message": "stored"})
+        assert not memory.should_skip_duplicate("unrelated text")  # builds the index
+
+        monkeypatch.setattr(memory, "_append_decision", lambda decision: False)
+        memory.add_decision({"action": "notify", "message": "Launch day post"})
+
+        assert memory._decision_count == 1
+        assert not memory.should_skip_duplicate("Launch day post")
+
+    def test_legacy_json_migrated(self, memory_dir):
+        """decisions.json from older versions is converted to JSONL"""
+        legacy = Path(memory_dir) / "decisions.json"
+        legacy.write_text(json.dumps([{"action": "notify", "message": "old"}]), encoding="utf-8")
+
+        memory = SimpleMemory(memory_dir=memory_dir)
+        memory.add_decision({"action": "notify", "message": "new"})
+
+        assert not legacy.exists()
+        assert [d["message"] for d in memory.load_decisions()] == ["old", "new"]
+
+    def test_legacy_json_kept_when_write_fails(self, memory_dir, monkeypatch):
+        """A failed JSONL write leaves decisions.json for the next start"""
+        legacy = Path(memory_dir) / "decisions.json"
+        legacy.write_text(json.dumps([{"action": "notify", "message": "old"}]), encoding="utf-8")
+
+        def _no_space(*_):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr("src.infrastructure.memory.os.replace", _no_space)
+        SimpleMemory(memory_dir=memory_dir)
+        monkeypatch.undo()
+
+        assert legacy.exists()
+        assert sorted(p.name for p in Path(memory_dir).iterdir()) == ["decisions.json"]
+        memory = SimpleMemory(memory_dir=memory_dir)
+        assert [d["message"] for d in memory.load_decisions()] == ["old"]
+
+    def test_legacy_json_not_a_list(self, memory_dir):
+        """An unexpected decisions.json shape is left alone"""
+        legacy = Path(memory_dir) / "decisions.json"
+        legacy.write_text(json.dumps({"message": "old"}), encoding="utf-8")
+
+        memory = SimpleMemory(memory_dir=memory_dir)
+
+        assert legacy.exists()
+        assert not memory.decisions_file.exists()
+
+    def test_get_context(self, memory_dir):
+        """Test getting context for AI"""
+        memory = SimpleMemory(memory_dir=memory_dir)
+
+        decision = {
+            "action": "notify",
+            "message": "Test context",
+            "reasoning": "Testing context"
+        }
+
+        memory.add_decision(decision)
+        context = memory.get_context()
+
+        assert "Recent Activity" in context
+        assert "Test context" in context
 
 
 class TestGuardrailMemory:
     """Test GuardrailMemory class"""
 
-    def test_initialization(self):
+    def test_initialization(self, memory_dir):
         """Test guardrail memory initialization"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = GuardrailMemory(memory_dir=tmpdir)
-            assert memory.violations_file.exists() or True  # File created on first write
+        memory = GuardrailMemory(memory_dir=memory_dir)
+        assert memory.violations_file.exists() or True  # File created on first write
 
-    def test_record_violation(self):
+    def test_record_violation(self, memory_dir):
         """Test recording guardrail violations"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = GuardrailMemory(memory_dir=tmpdir)
+        memory = GuardrailMemory(memory_dir=memory_dir)
+
+        memory.record_violation(
+            violation_type="file_access",
+            target="/etc/passwd",
+            reason="Sensitive file"
+        )
+
+        violations = memory.load_violations()
+        assert len(violations) == 1
+        assert violations[0]["type"] == "file_access"
+        assert violations[0]["target"] == "/etc/passwd"
+        assert violations[0]["blocked"] is True
+
+    def test_safety_context(self, memory_dir):
+        """Test getting safety context"""
+        memory = GuardrailMemory(memory_dir=memory_dir)
 
+        # Record some violations
+        for i in range(5):
             memory.record_violation(
                 violation_type="file_access",
                 target="/etc/passwd",
                 reason="Sensitive file"
             )
 
-            violations = memory.load_violations()
-            assert len(violations) == 1
-            assert violations[0]["type"] == "file_access"
-            assert violations[0]["target"] == "/etc/passwd"
-            assert violations[0]["blocked"] is True
+        safety_context = memory.get_safety_context()
 
-    def test_safety_context(self):
-        """Test getting safety context"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = GuardrailMemory(memory_dir=tmpdir)
+        assert "Security History" in safety_context
+        assert "Total violations blocked" in safety_context
+        assert "/etc/passwd" in safety_context
 
-            # Record some violations
-            for i in range(5):
-                memory.record_violation(
-                    violation_type="file_access",
-                    target="/etc/passwd",
-                    reason="Sensitive file"
-                )
+    def test_pattern_detection(self, memory_dir):
+        """Test pattern detection in violations"""
+        memory = GuardrailMemory(memory_dir=memory_dir)
 
-            safety_context = memory.get_safety_context()
+        # Record violations with patterns
+        targets = ["/etc/passwd", "/etc/shadow", "/etc/passwd", "/etc/passwd"]
+        for target in targets:
+            memory.record_violation(
+                violation_type="file_access",
+                target=target,
+                reason="Sensitive file"
+            )
 
-            assert "Security History" in safety_context
-            assert "Total violations blocked" in safety_context
-            assert "/etc/passwd" in safety_context
+        safety_context = memory.get_safety_context()
 
-    def test_pattern_detection(self):
-        """Test pattern detection in violations"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            memory = GuardrailMemory(memory_dir=tmpdir)
-
-            # Record violations with patterns
-            targets = ["/etc/passwd", "/etc/shadow", "/etc/passwd", "/etc/passwd"]
-            for target in targets:
-                memory.record_violation(
-                    violation_type="file_access",
-                    target=target,
-                    reason="Sensitive file"
-                )
-
-            safety_context = memory.get_safety_context()
-
-            # Should detect /etc/passwd as most frequent
-            assert "/etc/passwd" in safety_context
-            assert "3 times" in safety_context
+        # Should detect /etc/passwd as most frequent
+        assert "/etc/passwd" in safety_context
+        assert "3 times" in safety_context
 
 
 if __name__ == "__main__":
@@ -1,102 +1,92 @@
 """Unit tests for SNS routes."""
 
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, AsyncMock
+from fastapi import HTTPException
 from httpx import AsyncClient, ASGITransport
 
 from src.adapters.web.server import app
+from src.adapters.web.sns_routes import (
+    SNSPostRequest,
+    SNSReplyRequest,
+    threads_post,
+    threads_reply,
+    x_post,
+    x_reply,
+)
 from src.adapters.sns.x import XPostResult
 from src.adapters.sns.threads import ThreadsPostResult
+from src.config import CONFIG
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def direct_posting(monkeypatch):
+    """These tests cover the direct-post path, not the approval queue."""
+    monkeypatch.setitem(CONFIG, "require_manual_approval", False)
 
 
 @pytest.fixture
-def transport():
-    return ASGITransport(app=app)
-
-
-class TestXRoutes:
-    @pytest.mark.asyncio
-    async def test_x_post_unconfigured(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/x/post", json={"text": "hi"})
-        assert resp.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_x_post_success(self, transport):
-        result = XPostResult(success=True, post_id="1", text="hi")
-        with patch("src.adapters.web.sns_routes.x_client") as mock:
-            mock.is_configured = True
-            mock.post = AsyncMock(return_value=result)
-            async with AsyncClient(transport=transport, base_url="http://test") as ac:
-                resp = await ac.post("/sns/x/post", json={"text": "hi"})
+def sns_client(request):
+    """Configured stand-in for the routes' client named by the indirect param."""
+    patcher = patch(f"src.adapters.web.sns_routes.{request.param}")
+    mock = patcher.start()
+    mock.is_configured = True
+    mock.post = AsyncMock()
+    mock.reply = AsyncMock()
+    yield mock
+    patcher.stop()
+
+
+class TestUnconfigured:
+    """The 503 branch needs no routing or serialization, so call the handlers directly."""
+
+    @pytest.mark.parametrize("sns_client,handler,req", [
+        ("x_client", x_post, SNSPostRequest(text="hi")),
+        ("x_client", x_reply, SNSReplyRequest(text="hi", post_id="1")),
+        ("threads_client", threads_post, SNSPostRequest(text="hi")),
+        ("threads_client", threads_reply, SNSReplyRequest(text="hi", post_id="1")),
+    ], ids=["x_post", "x_reply", "threads_post", "threads_reply"], indirect=["sns_client"])
+    async def test_unconfigured(self, sns_client, handler, req):
+        sns_client.is_configured = False
+        with pytest.raises(HTTPException) as exc:
+            await handler(req)
+        assert exc.value.status_code == 503
+
+
+class TestRouteSuccess:
+    @pytest.mark.parametrize("sns_client,method,endpoint,payload,result", [
+        ("x_client", "post", "/sns/x/post", {"text": "hi"},
+         XPostResult(success=True, post_id="1", text="hi")),
+        ("x_client", "reply", "/sns/x/reply", {"text": "reply", "post_id": "1"},
+         XPostResult(success=True, post_id="2", text="reply")),
+        ("threads_client", "post", "/sns/threads/post", {"text": "hi"},
+         ThreadsPostResult(success=True, post_id="t1", text="hi")),
+        ("threads_client", "reply", "/sns/threads/reply", {"text": "reply", "post_id": "t1"},
+         ThreadsPostResult(success=True, post_id="tr1", text="reply")),
+    ], ids=["x_post", "x_reply", "threads_post", "threads_reply"], indirect=["sns_client"])
+    async def test_route_success(self, client, sns_client, method, endpoint, payload, result):
+        getattr(sns_client, method).return_value = result
+        resp = await client.post(endpoint, json=payload)
         assert resp.status_code == 200
         data = resp.json()
         assert data["success"] is True
-        assert data["post_id"] == "1"
-
-    @pytest.mark.asyncio
-    async def test_x_reply_unconfigured(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/x/reply", json={"text": "hi", "post_id": "1"})
-        assert resp.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_x_reply_success(self, transport):
-        result = XPostResult(success=True, post_id="2", text="reply")
-        with patch("src.adapters.web.sns_routes.x_client") as mock:
-            mock.is_configured = True
-            mock.reply = AsyncMock(return_value=result)
-            async with AsyncClient(transport=transport, base_url="http://test") as ac:
-                resp = await ac.post("/sns/x/reply", json={"text": "reply", "post_id": "1"})
-        assert resp.status_code == 200
-        assert resp.json()["post_id"] == "2"
-
-
-class TestThreadsRoutes:
-    @pytest.mark.asyncio
-    async def test_threads_post_unconfigured(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/threads/post", json={"text": "hi"})
-        assert resp.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_threads_post_success(self, transport):
-        result = ThreadsPostResult(success=True, post_id="t1", text="hi")
-        with patch("src.adapters.web.sns_routes.threads_client") as mock:
-            mock.is_configured = True
-            mock.post = AsyncMock(return_value=result)
-            async with AsyncClient(transport=transport, base_url="http://test") as ac:
-                resp = await ac.post("/sns/threads/post", json={"text": "hi"})
-        assert resp.status_code == 200
-        assert resp.json()["post_id"] == "t1"
-
-    @pytest.mark.asyncio
-    async def test_threads_reply_unconfigured(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/threads/reply", json={"text": "hi", "post_id": "1"})
-        assert resp.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_threads_reply_success(self, transport):
-        result = ThreadsPostResult(success=True, post_id="tr1", text="reply")
-        with patch("src.adapters.web.sns_routes.threads_client") as mock:
-            mock.is_configured = True
-            mock.reply = AsyncMock(return_value=result)
-            async with AsyncClient(transport=transport, base_url="http://test") as ac:
-                resp = await ac.post("/sns/threads/reply", json={"text": "reply", "post_id": "t1"})
-        assert resp.status_code == 200
-        assert resp.json()["post_id"] == "tr1"
+        assert data["post_id"] == result.post_id
 
 
 class TestValidation:
-    @pytest.mark.asyncio
-    async def test_missing_text(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/x/post", json={})
+    async def test_missing_text(self, client):
+        resp = await client.post("/sns/x/post", json={})
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
-    async def test_reply_missing_post_id(self, transport):
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.post("/sns/threads/reply", json={"text": "hi"})
+    async def test_reply_missing_post_id(self, client):
+        resp = await client.post("/sns/threads/reply", json={"text": "hi"})
         assert resp.status_code == 422
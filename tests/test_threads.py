@@ -2,42 +2,49 @@
 
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
-from aiohttp import ClientSession
 
-from src.adapters.sns.threads import ThreadsClient, ThreadsPostResult, THREADS_API_BASE
+from src.adapters.sns.threads import ThreadsClient, ThreadsPostResult
+
+# Payloads around the 500-char truncation limit
+_TEXT_AT_LIMIT = "a" * 500
+_TEXT_OVER_LIMIT = "a" * 600
+_TEXT_50 = "a" * 50
+
+
+@pytest.fixture(scope="module")
+def client():
+    """ThreadsClient holds no state; is_configured reads CONFIG on each access."""
+    return ThreadsClient()
 
 
 @pytest.fixture
-def threads_configured(monkeypatch):
-    monkeypatch.setattr("src.adapters.sns.threads.CONFIG", {
+def threads_configured(set_config):
+    set_config({
         "threads_user_id": "user123",
         "threads_access_token": "tok456",
     })
 
 
 @pytest.fixture
-def threads_unconfigured(monkeypatch):
-    monkeypatch.setattr("src.adapters.sns.threads.CONFIG", {
+def threads_unconfigured(set_config):
+    set_config({
         "threads_user_id": "",
         "threads_access_token": "",
     })
 
 
 class TestIsConfigured:
-    def test_configured(self, threads_configured):
-        client = ThreadsClient()
+    def test_configured(self, threads_configured, client):
         assert client.is_configured is True
 
-    def test_unconfigured(self, threads_unconfigured):
-        client = ThreadsClient()
+    def test_unconfigured(self, threads_unconfigured, client):
         assert client.is_configured is False
 
-    def test_partial(self, monkeypatch):
-        monkeypatch.setattr("src.adapters.sns.threads.CONFIG", {
+    def test_partial(self, set_config, client):
+        set_config({
             "threads_user_id": "user123",
             "threads_access_token": "",
         })
-        client = ThreadsClient()
         assert client.is_configured is False
 
 
@@ -46,17 +53,17 @@ class TestTruncateText:
         assert ThreadsClient.truncate_text("hello") == "hello"
 
     def test_exact_limit(self):
-        text = "a" * 500
+        text = _TEXT_AT_LIMIT
         assert ThreadsClient.truncate_text(text) == text
 
     def test_over_limit(self):
-        text = "a" * 600
+        text = _TEXT_OVER_LIMIT
         result = ThreadsClient.truncate_text(text)
         assert len(result) == 500
         assert result.endswith("...")
 
     def test_custom_limit(self):
-        text = "a" * 50
+        text = _TEXT_50
         result = ThreadsClient.truncate_text(text, limit=20)
         assert len(result) == 20
         assert result.endswith("...")
@@ -64,47 +71,24 @@ class TestTruncateText:
 
 def _mock_aiohttp_session(responses):
     """Return a mock that replaces aiohttp.ClientSession context manager.
-    responses: list of dicts, each consumed in order by successive post() calls.
+    responses: list of dicts, each consumed in order by successive resp.json() calls.
     """
-    call_idx = 0
-
-    class FakeResponse:
-        def __init__(self, data):
-            self._data = data
-
-        async def json(self):
-            return self._data
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, *args):
-            pass
-
-    class FakeSession:
-        def post(self, url, **kwargs):
-            nonlocal call_idx
-            resp = FakeResponse(responses[call_idx])
-            call_idx += 1
-            return resp
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, *args):
-            pass
-
-    return FakeSession
+    resp = MagicMock()
+    resp.__aenter__.return_value = resp
+    resp.json = AsyncMock(side_effect=responses)
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.post.return_value = resp
+    return MagicMock(return_value=session)
 
 
 class TestPost:
     @pytest.mark.asyncio
-    async def test_post_success(self, threads_configured):
+    async def test_post_success(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"id": "container_1"},  # create container
             {"id": "post_1"},       # publish
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
             result = await client.post("Hello Threads")
         assert result.success is True
@@ -112,60 +96,55 @@ class TestPost:
         assert result.text == "Hello Threads"
 
     @pytest.mark.asyncio
-    async def test_post_container_error(self, threads_configured):
+    async def test_post_container_error(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"error": {"message": "Invalid token"}},
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
             result = await client.post("Hello")
         assert result.success is False
         assert "Invalid token" in result.error
 
     @pytest.mark.asyncio
-    async def test_post_publish_error(self, threads_configured):
+    async def test_post_publish_error(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"id": "container_1"},
             {"error": {"message": "Publish failed"}},
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
             result = await client.post("Hello")
         assert result.success is False
         assert "Publish failed" in result.error
 
     @pytest.mark.asyncio
-    async def test_post_truncates(self, threads_configured):
+    async def test_post_truncates(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"id": "c1"},
             {"id": "p1"},
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
-            result = await client.post("x" * 600)
+            result = await client.post(_TEXT_OVER_LIMIT)
         assert result.success is True
         assert len(result.text) == 500
 
 
 class TestReply:
     @pytest.mark.asyncio
-    async def test_reply_success(self, threads_configured):
+    async def test_reply_success(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"id": "container_r"},
             {"id": "reply_1"},
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
             result = await client.reply("Reply text", "post_1")
         assert result.success is True
         assert result.post_id == "reply_1"
 
     @pytest.mark.asyncio
-    async def test_reply_failure(self, threads_configured):
+    async def test_reply_failure(self, threads_configured, client):
         mock_session = _mock_aiohttp_session([
             {"error": {"message": "Not found"}},
         ])
-        client = ThreadsClient()
         with patch("src.adapters.sns.threads.aiohttp.ClientSession", mock_session):
             result = await client.reply("Reply", "bad_id")
         assert result.success is False
@@ -11,84 +11,103 @@ from src.infrastructure.usage import UsageTracker, UsageLimitExceeded
 from src.config import CONFIG
 
 
+@pytest.fixture(scope="module")
+def _usage_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("usage")
+
+
 @pytest.fixture
-def tracker(tmp_path):
-    """Create a UsageTracker with a temporary usage file"""
-    usage_file = tmp_path / "usage.json"
-    t = UsageTracker(usage_file=str(usage_file))
+def tracker(_usage_dir, monkeypatch):
+    """Create a UsageTracker whose data stays in memory.
+
+    _save is a no-op, so usage.json is never written and the shared
+    directory stays empty; TestPersistence uses a real file instead.
+    """
+    t = UsageTracker(usage_file=str(_usage_dir / "usage.json"))
+    monkeypatch.setattr(t, "_save", lambda: None)
     return t
 
 
+def _bulk_record(tracker, n):
+    """Record n calls at the current time directly in the tracker's in-memory data"""
+    now = datetime.now().isoformat()
+    tracker._data["calls"].extend([now] * n)
+    tracker._data["total_calls"] += n
+
+
+# Snapshot taken once at import; values are flat scalars, so a shallow copy suffices
+_ORIGINAL_LIMITS = dict(CONFIG["usage_limits"])
+
+
 @pytest.fixture(autouse=True)
 def reset_config():
-    """Reset CONFIG usage_limits before each test"""
-    original = CONFIG["usage_limits"].copy()
+    """Restore CONFIG usage_limits in place after each test.
+
+    Trackers hold a reference to this dict, so it is updated rather than replaced.
+    """
     yield
-    CONFIG["usage_limits"] = original
+    limits = CONFIG["usage_limits"]
+    if limits != _ORIGINAL_LIMITS:
+        limits.clear()
+        limits.update(_ORIGINAL_LIMITS)
+
+
+@pytest.fixture
+def unlimited():
+    """Disable every limit; tests then tighten only the one under test."""
+    CONFIG["usage_limits"].update({
+        "min_call_interval_seconds": 0,
+        "max_calls_per_minute": 999,
+        "max_calls_per_hour": 999,
+        "max_calls_per_day": 999,
+        "paused": False,
+    })
 
 
 class TestDailyLimit:
-    def test_blocks_when_daily_limit_reached(self, tracker):
+    def test_blocks_when_daily_limit_reached(self, tracker, unlimited):
         """Should raise UsageLimitExceeded when daily call limit is reached"""
         CONFIG["usage_limits"]["max_calls_per_day"] = 3
-        CONFIG["usage_limits"]["min_call_interval_seconds"] = 0
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
 
-        for _ in range(3):
-            tracker.record_call()
+        _bulk_record(tracker, 3)
 
         with pytest.raises(UsageLimitExceeded, match="Daily limit"):
             tracker.check_limits()
 
-    def test_allows_under_daily_limit(self, tracker):
+    def test_allows_under_daily_limit(self, tracker, unlimited):
         """Should not raise when under the daily limit"""
         CONFIG["usage_limits"]["max_calls_per_day"] = 5
-        CONFIG["usage_limits"]["min_call_interval_seconds"] = 0
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
 
-        for _ in range(4):
-            tracker.record_call()
+        _bulk_record(tracker, 4)
 
         # Should not raise
         tracker.check_limits()
 
 
 class TestPerMinuteLimit:
-    def test_blocks_when_per_minute_limit_reached(self, tracker):
+    def test_blocks_when_per_minute_limit_reached(self, tracker, unlimited):
         """Should raise UsageLimitExceeded when per-minute limit is reached"""
         CONFIG["usage_limits"]["max_calls_per_minute"] = 2
-        CONFIG["usage_limits"]["min_call_interval_seconds"] = 0
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
-        CONFIG["usage_limits"]["max_calls_per_day"] = 999
 
-        for _ in range(2):
-            tracker.record_call()
+        _bulk_record(tracker, 2)
 
         with pytest.raises(UsageLimitExceeded, match="Per-minute limit"):
             tracker.check_limits()
 
 
 class TestCooldown:
-    def test_blocks_during_cooldown(self, tracker):
+    def test_blocks_during_cooldown(self, tracker, unlimited):
         """Should raise UsageLimitExceeded during cooldown period"""
         CONFIG["usage_limits"]["min_call_interval_seconds"] = 10
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
-        CONFIG["usage_limits"]["max_calls_per_day"] = 999
 
         tracker.record_call()
 
         with pytest.raises(UsageLimitExceeded, match="Cooldown"):
             tracker.check_limits()
 
-    def test_allows_after_cooldown(self, tracker):
+    def test_allows_after_cooldown(self, tracker, unlimited):
         """Should allow calls after cooldown period has elapsed"""
         CONFIG["usage_limits"]["min_call_interval_seconds"] = 1
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
-        CONFIG["usage_limits"]["max_calls_per_day"] = 999
 
         # Manually insert a call timestamp in the past
         past_time = (datetime.now() - timedelta(seconds=5)).isoformat()
@@ -116,16 +135,12 @@ class TestPause:
 
 
 class TestWarning:
-    def test_returns_warning_at_threshold(self, tracker):
+    def test_returns_warning_at_threshold(self, tracker, unlimited):
         """Should return warning when daily usage hits threshold"""
         CONFIG["usage_limits"]["max_calls_per_day"] = 10
         CONFIG["usage_limits"]["warning_threshold_pct"] = 80
-        CONFIG["usage_limits"]["min_call_interval_seconds"] = 0
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
 
-        for _ in range(8):
-            tracker.record_call()
+        _bulk_record(tracker, 8)
 
         warning = tracker.get_warning()
         assert warning is not None
@@ -136,23 +151,17 @@ class TestWarning:
         CONFIG["usage_limits"]["max_calls_per_day"] = 10
         CONFIG["usage_limits"]["warning_threshold_pct"] = 80
 
-        for _ in range(5):
-            tracker.record_call()
+        _bulk_record(tracker, 5)
 
         warning = tracker.get_warning()
         assert warning is None
 
 
 class TestPersistence:
-    def test_data_persists_across_instances(self, tmp_path):
+    def test_data_persists_across_instances(self, tmp_path, unlimited):
         """Usage data should persist when a new tracker instance is created"""
         usage_file = tmp_path / "usage.json"
 
-        CONFIG["usage_limits"]["min_call_interval_seconds"] = 0
-        CONFIG["usage_limits"]["max_calls_per_minute"] = 999
-        CONFIG["usage_limits"]["max_calls_per_hour"] = 999
-        CONFIG["usage_limits"]["max_calls_per_day"] = 999
-
         # First instance: record calls
         tracker1 = UsageTracker(usage_file=str(usage_file))
         tracker1.record_call()
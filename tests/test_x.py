@@ -1,20 +1,49 @@
 """Unit tests for XClient."""
 
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from types import SimpleNamespace
 
 from src.adapters.sns.x import XClient, XPostResult
 
+# Payloads around the 280-char truncation limit
+_TEXT_AT_LIMIT = "a" * 280
+_TEXT_OVER_LIMIT = "a" * 300
+_TEXT_50 = "a" * 50
 
-@pytest.fixture(autouse=True)
-def _clear_client():
-    """Reset module-level state between tests."""
-    yield
+
+@pytest.fixture(scope="module")
+def _x_client():
+    return XClient()
+
+
+@pytest.fixture
+def client(_x_client):
+    """Module-wide XClient; the injected tweepy mock is dropped after each test."""
+    yield _x_client
+    _x_client._client = None
+
+
+# create_tweet results shared by the post/reply tests
+_POSTED = SimpleNamespace(data={"id": "12345"})
+_REPLIED = SimpleNamespace(data={"id": "67890"})
+
+
+@pytest.fixture(scope="module")
+def _tweepy():
+    return MagicMock()
+
+
+@pytest.fixture
+def tweepy(client, _tweepy):
+    """Module-wide tweepy.Client double, injected into the client and reset per test."""
+    _tweepy.reset_mock(return_value=True, side_effect=True)
+    client._client = _tweepy
+    return _tweepy
 
 
 @pytest.fixture
-def x_configured(monkeypatch):
+def x_configured(set_config):
     """Patch CONFIG so X keys are present."""
     fake = {
         "x_consumer_key": "ck",
@@ -22,13 +51,13 @@ def x_configured(monkeypatch):
         "x_access_token": "at",
         "x_access_token_secret": "ats",
     }
-    monkeypatch.setattr("src.adapters.sns.x.CONFIG", {**fake})
+    set_config(fake)
     return fake
 
 
 @pytest.fixture
-def x_unconfigured(monkeypatch):
-    monkeypatch.setattr("src.adapters.sns.x.CONFIG", {
+def x_unconfigured(set_config):
+    set_config({
         "x_consumer_key": "",
         "x_consumer_secret": "",
         "x_access_token": "",
@@ -37,22 +66,19 @@ def x_unconfigured(monkeypatch):
 
 
 class TestIsConfigured:
-    def test_configured(self, x_configured):
-        client = XClient()
+    def test_configured(self, x_configured, client):
         assert client.is_configured is True
 
-    def test_unconfigured(self, x_unconfigured):
-        client = XClient()
+    def test_unconfigured(self, x_unconfigured, client):
         assert client.is_configured is False
 
-    def test_partial(self, monkeypatch):
-        monkeypatch.setattr("src.adapters.sns.x.CONFIG", {
+    def test_partial(self, set_config, client):
+        set_config({
             "x_consumer_key": "ck",
             "x_consumer_secret": "",
             "x_access_token": "at",
             "x_access_token_secret": "ats",
         })
-        client = XClient()
         assert client.is_configured is False
 
 
@@ -61,17 +87,17 @@ class TestTruncateText:
         assert XClient.truncate_text("hello") == "hello"
 
     def test_exact_limit(self):
-        text = "a" * 280
+        text = _TEXT_AT_LIMIT
         assert XClient.truncate_text(text) == text
 
     def test_over_limit(self):
-        text = "a" * 300
+        text = _TEXT_OVER_LIMIT
         result = XClient.truncate_text(text)
         assert len(result) == 280
         assert result.endswith("...")
 
     def test_custom_limit(self):
-        text = "a" * 50
+        text = _TEXT_50
         result = XClient.truncate_text(text, limit=20)
         assert len(result) == 20
         assert result.endswith("...")
@@ -79,13 +105,8 @@ class TestTruncateText:
 
 class TestPost:
     @pytest.mark.asyncio
-    async def test_post_success(self, x_configured):
-        client = XClient()
-        mock_tweepy = MagicMock()
-        mock_tweepy.create_tweet.return_value = SimpleNamespace(
-            data={"id": "12345"}
-        )
-        client._client = mock_tweepy
+    async def test_post_success(self, x_configured, client, tweepy):
+        tweepy.create_tweet.return_value = _POSTED
 
         result = await client.post("Hello world")
         assert result.success is True
@@ -94,11 +115,8 @@ class TestPost:
         assert result.error is None
 
     @pytest.mark.asyncio
-    async def test_post_failure(self, x_configured):
-        client = XClient()
-        mock_tweepy = MagicMock()
-        mock_tweepy.create_tweet.side_effect = Exception("API error")
-        client._client = mock_tweepy
+    async def test_post_failure(self, x_configured, client, tweepy):
+        tweepy.create_tweet.side_effect = Exception("API error")
 
         result = await client.post("Hello world")
         assert result.success is False
@@ -106,43 +124,29 @@ class TestPost:
         assert result.error == "API error"
 
     @pytest.mark.asyncio
-    async def test_post_truncates(self, x_configured):
-        client = XClient()
-        mock_tweepy = MagicMock()
-        mock_tweepy.create_tweet.return_value = SimpleNamespace(
-            data={"id": "99"}
-        )
-        client._client = mock_tweepy
+    async def test_post_truncates(self, x_configured, client, tweepy):
+        tweepy.create_tweet.return_value = _POSTED
 
-        long = "x" * 300
-        result = await client.post(long)
+        result = await client.post(_TEXT_OVER_LIMIT)
         assert result.success is True
         assert len(result.text) == 280
 
 
 class TestReply:
     @pytest.mark.asyncio
-    async def test_reply_success(self, x_configured):
-        client = XClient()
-        mock_tweepy = MagicMock()
-        mock_tweepy.create_tweet.return_value = SimpleNamespace(
-            data={"id": "67890"}
-        )
-        client._client = mock_tweepy
+    async def test_reply_success(self, x_configured, client, tweepy):
+        tweepy.create_tweet.return_value = _REPLIED
 
         result = await client.reply("Reply text", "12345")
         assert result.success is True
         assert result.post_id == "67890"
-        mock_tweepy.create_tweet.assert_called_once_with(
+        tweepy.create_tweet.assert_called_once_with(
             text="Reply text", in_reply_to_tweet_id="12345"
         )
 
     @pytest.mark.asyncio
-    async def test_reply_failure(self, x_configured):
-        client = XClient()
-        mock_tweepy = MagicMock()
-        mock_tweepy.create_tweet.side_effect = Exception("Not found")
-        client._client = mock_tweepy
+    async def test_reply_failure(self, x_configured, client, tweepy):
+        tweepy.create_tweet.side_effect = Exception("Not found")
 
         result = await client.reply("Reply text", "12345")
         assert result.success is False